@@ -1,6 +1,9 @@
 # Importing the required libraries
 import torch
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import matplotlib.pyplot as plt
 import os
 import seaborn as sns
@@ -11,12 +14,48 @@ from collections import Counter
 import re
 import torch
 from torchtext.vocab import vocab
-from torch.utils.data import Dataset
+from torch.utils.data import Dataset, DataLoader
 from nltk.stem import WordNetLemmatizer
-import subprocess
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from multiprocessing import Pool, cpu_count
+from functools import lru_cache, partial
+from itertools import batched
 
-nltk.download("punkt")
-nltk.download('wordnet')
+# Downloading the required NLTK data if missing
+def download_nltk_resource(package, path):
+    """
+    Downloads the NLTK package only if it is not already available locally, so importing this 
+    module (including in every worker process) does not hit the network each time.
+
+    Parameters
+    ----------
+    package : str
+        Name of the NLTK package to download.
+    path : str
+        Path of the resource inside the NLTK data directory. The zipped resource at path + ".zip"
+        is also accepted, since NLTK can read corpora such as wordnet straight from the zip.
+
+    Returns
+    -------
+    None.
+    """
+    
+    for resource_path in (path, path + ".zip"):
+        try:
+            nltk.data.find(resource_path)
+            return
+        except LookupError:
+            pass
+    nltk.download(package, quiet = True)
+
+download_nltk_resource("punkt", "tokenizers/punkt")
+download_nltk_resource("wordnet", "corpora/wordnet")
+
+# Pre-compiled patterns used for cleaning the review texts
+_STRIP_RE = re.compile(r"[^a-z.?!:)( \n]+")
+_DOTS_RE = re.compile(r"\.{2,}")
 
 
 #------------------------------------------------------------------------------
@@ -45,7 +84,7 @@ def cleanup_text(text):
     Performs the following tasks on the text:
         - lowercasing all the characters
         - removing non-alphabet characters excluding "., !, (, ), \n, :, ?"
-        - removing any multiple consecutive occurence of the excluded characters above
+        - collapsing multiple consecutive dots into a single dot
     
     Parameters
     ----------
@@ -58,25 +97,58 @@ def cleanup_text(text):
         cleaned text.
     """
     
-    text = text.lower()
-    text = re.sub(r"[^a-z.?!:)( \n]+", "", text)
-    text = re.sub(r"\.{2,}", ".", text)
-    text = re.sub(r"\.{2,}", "!", text)
-    text = re.sub(r"\.{2,}", "?", text)
-    text = re.sub(r"\.{2,}", ")", text)
-    text = re.sub(r"\.{2,}", "(", text)
-    text = re.sub(r"\.{2,}", ":", text)
-    return text
+    return _DOTS_RE.sub(".", _STRIP_RE.sub("", text.lower()))
+
+def cleanup_texts(texts):
+    """
+    Performs the same cleaning as cleanup_text on all the texts of a pandas Series at once. For
+    Arrow backed Series the lowercasing and the regex replacements run in Arrow's compute kernels 
+    (using the RE2 engine) over the whole column, otherwise pandas falls back to Python's re module.
+
+    Parameters
+    ----------
+    texts : pandas Series
+        Series of texts to be cleaned.
+
+    Returns
+    -------
+    texts : pandas Series
+        Series of cleaned texts.
+    """
+    
+    return texts.str.lower()\
+                .str.replace(_STRIP_RE.pattern, "", regex = True)\
+                .str.replace(_DOTS_RE.pattern, ".", regex = True)
 
-def create_vocab(text, tokenizer, lemmatizer, unk_token, pad_token):
+@lru_cache(maxsize = 200_000)
+def _lemmatize(lemmatizer, word):
+    """
+    Lemmantizes a single word using the lemmatizer. The results are cached since the reviews 
+    repeat the same words many times.
+    """
+    
+    return lemmatizer.lemmatize(word)
+
+def _count_tokens(reviews, tokenizer):
+    """
+    Tokenizes a batch of reviews and counts the instances of each token.
+    """
+    
+    token_counts = Counter()
+    for review in reviews:
+        token_counts.update(tokenizer(review))
+    return token_counts
+
+def create_vocab(reviews, tokenizer, lemmatizer, unk_token, pad_token):
     """
     Creates a vocabulary based on the input text corpus that assigns an index 
     to each token.
 
     Parameters
     ----------
-    text : str
-        The text corpus used for token extraction.
+    reviews : iterable[str]
+        The cleaned review texts of the corpus used for token extraction. They are consumed one 
+        at a time, so a generator could be passed.
     tokenizer : obj
         Tokenizer object for tokenization of the text.
     lemmatizer : obj
@@ -93,19 +165,45 @@ def create_vocab(text, tokenizer, lemmatizer, unk_token, pad_token):
 
     """
     
-    # Tookenizing the text
-    tokenized_text = tokenizer(text)
-    # Lemmantizing the text
-    lemmatized_text = [lemmatizer.lemmatize(word) for word in tokenized_text]
-    # Creating a hash map counting the instances of each token
-    token_freqs = Counter(lemmatized_text)
+    # Tookenizing batches of reviews in worker processes and counting the instances of each token.
+    # The counts are merged in the order of the batches so the tokens keep their first occurence order.
+    token_counts = Counter()
+    with Pool(cpu_count()) as pool:
+        for batch_counts in pool.imap(partial(_count_tokens, tokenizer = tokenizer), batched(reviews, 512)):
+            token_counts.update(batch_counts)
+    # Lemmantizing each distinct token once and summing the counts of tokens sharing a lemma.
+    # Lemmas are inserted in order of their first occurence, same as counting the lemmatized text.
+    token_freqs = Counter()
+    for token, count in token_counts.items():
+        token_freqs[_lemmatize(lemmatizer, token)] += count
     # Creating a vocabulary 
     vocabulary = vocab(token_freqs, min_freq = 10, specials = [pad_token, unk_token])
     # Setting the index that should be assigned to OOV tokens.
     vocabulary.set_default_index(1)
     return vocabulary
 
-def process_reviews(review, tokenizer, lemmatizer, vocabulary, max_len, pad = True):
+def create_token_index(vocabulary):
+    """
+    Creates a dictionary mapping each token of the vocabulary to its index. Looking the tokens 
+    up in a plain dictionary is faster than calling the vocabulary object for each review. 
+    Also returns the default index of the vocabulary that is assigned to the OOV tokens.
+
+    Parameters
+    ----------
+    vocabulary : obj
+        Vocabulary object correspoding tokens and indices.
+
+    Returns
+    -------
+    token2idx : dict
+        Dictionary mapping each token to its index.
+    unk_index : int
+        Index assigned to the out of vocabulary tokens.
+    """
+    
+    return dict(zip(vocabulary.get_itos(), range(len(vocabulary)))), vocabulary.get_default_index()
+
+def process_reviews(review, tokenizer, lemmatizer, token2idx, unk_index, max_len, pad = True):
     """
     Performs the following tasks on each review text:
         - cleaning the text
@@ -122,8 +220,10 @@ def process_reviews(review, tokenizer, lemmatizer, vocabulary, max_len, pad = Tr
         Tokenizer object for tokenization of the text.
     lemmatizer : obj
         Lemmantizer onject for Llmmantization of the text.
-    vocabulary : obj
-        Vocabulary object correspoding tokens and indices.
+    token2idx : dict
+        Dictionary mapping the tokens to their indices, created by create_token_index.
+    unk_index : int
+        Index assigned to the tokens missing from token2idx, created by create_token_index.
     max_len : int
         Maximum allowed length of a product review.
     pad : boolean
@@ -131,64 +231,187 @@ def process_reviews(review, tokenizer, lemmatizer, vocabulary, max_len, pad = Tr
 
     Returns
     -------
-    review_processed : list
-        A list of indices.
+    review_processed : numpy.ndarray
+        An int32 array of indices.
     """
     
-    review_cleaned = cleanup_text(review)
-    review_tokenized = tokenizer(review_cleaned)
-    lemmatized_text = [lemmatizer.lemmatize(word) for word in review_tokenized]
-    review_processed = vocabulary(lemmatized_text)
+    return encode_review(cleanup_text(review), tokenizer, lemmatizer, token2idx, unk_index, max_len, pad)
+
+def encode_review(review_cleaned, tokenizer, lemmatizer, token2idx, unk_index, max_len, pad = True):
+    """
+    Performs the steps of process_reviews after the cleaning on an already cleaned review text.
+
+    Parameters
+    ----------
+    review_cleaned : str
+        The product review text cleaned by cleanup_text or cleanup_texts.
+    tokenizer : obj
+        Tokenizer object for tokenization of the text.
+    lemmatizer : obj
+        Lemmantizer onject for Llmmantization of the text.
+    token2idx : dict
+        Dictionary mapping the tokens to their indices, created by create_token_index.
+    unk_index : int
+        Index assigned to the tokens missing from token2idx, created by create_token_index.
+    max_len : int
+        Maximum allowed length of a product review.
+    pad : boolean
+        Either to pad the input or not.
 
-    if pad and len(review_processed) < max_len:
-        review_processed.extend([0] * (max_len - len(review_processed)))
-    elif len(review_processed) > max_len:
-        review_processed = review_processed[:max_len]
+    Returns
+    -------
+    review_processed : numpy.ndarray
+        An int32 array of indices.
+    """
+    
+    # Truncating the tokens before lemmantization since the extra tokens are dropped anyway
+    review_tokenized = tokenizer(review_cleaned)[:max_len]
+    lemmatized_text = [_lemmatize(lemmatizer, word) for word in review_tokenized]
+    indices = [token2idx.get(word, unk_index) for word in lemmatized_text]
+    
+    # Writing the indices into a zero filled array, the remaining zeros are the padding
+    review_processed = np.zeros(max_len if pad else len(indices), dtype = np.int32)
+    review_processed[:len(indices)] = indices
     return review_processed
 
-def convert_to_tensor(dataframe):
+def _init_worker(tokenizer, lemmatizer, token2idx, unk_index, max_len):
+    """
+    Stores the arguments of encode_review in the globals of a worker process, so they are 
+    sent to each worker once instead of being pickled with every task.
+    """
+    
+    global _worker_args
+    _worker_args = (tokenizer, lemmatizer, token2idx, unk_index, max_len)
+
+def _encode_review_worker(review_cleaned):
+    """
+    Runs encode_review on a single cleaned review using the arguments stored by _init_worker.
+    """
+    
+    return encode_review(review_cleaned, *_worker_args)
+
+def convert_to_tensor(reviews_processed, sentiments):
     """
-    Converts the dataframe values into a list of tensors and appending the sentiment for each
-    review to the review tensor.
+    Converts the processed reviews and their sentiments into a tensor of review indices and a 
+    tensor of sentiments.
 
     Parameters
     ----------
-    dataframe : pandas DataFrame
-        Dataframe whose data to be converted.
+    reviews_processed : numpy.ndarray
+        An int32 array of shape (num_reviews, max_len) containing the indices of each review.
+    sentiments : numpy.ndarray
+        An int32 array of shape (num_reviews,) containing the sentiment of each review.
 
     Returns
     -------
-    combined_tensor : list[torch.tensor]
-        A list of torch tensors containing the indices of each review and the sentiment 
-        as the last element.
+    review_tensor : torch.tensor
+        A tensor of shape (num_reviews, max_len) containing the indices of each review.
+    sentiment_tensor : torch.tensor
+        A tensor of shape (num_reviews,) containing the sentiment of each review.
     """
     
-    # Converting the dataset values to lists
-    review_processed_values = dataframe['review_processed'].tolist()
-    sentiment_values = dataframe['sentiment'].tolist()
-    #Converting dataset values to tensors
-    review_processed_tensor = torch.tensor(review_processed_values)
-    sentiment_tensor = torch.tensor(sentiment_values)
-    # Appending the sentiment to the review indices tensor as the last element
-    sentiment_tensor = sentiment_tensor.unsqueeze(1)
-    combined_tensor = torch.cat((review_processed_tensor, sentiment_tensor), dim=1)
-    return combined_tensor
+    # Wrapping the arrays in tensors without copying them
+    review_tensor = torch.from_numpy(reviews_processed)
+    sentiment_tensor = torch.from_numpy(sentiments)
+    return review_tensor, sentiment_tensor
     
 
 class dataset(Dataset):
     """
-    Pytorch Dataset class for converting the pandas dataframes into datasets
+    Pytorch Dataset class for converting the pandas dataframes into datasets. Each item is a 
+    tuple of the review indices and the review sentiment.
     """
-    def __init__(self,data):
-        self.data = data
+    def __init__(self, reviews, sentiments):
+        self.reviews = reviews
+        self.sentiments = sentiments
     
     def __len__(self):
-        return len(self.data)
+        return len(self.reviews)
     
     def __getitem__(self, index):
-        return self.data[index]
+        return self.reviews[index], self.sentiments[index]
+    
+    def __setstate__(self, state):
+        # Datasets saved before the reviews and sentiments were separated store a single tensor 
+        # with the sentiment as the last element of each row
+        if "data" in state:
+            data = state.pop("data")
+            state["reviews"] = data[:, :-1]
+            state["sentiments"] = data[:, -1]
+        self.__dict__.update(state)
+
+class data_prefetcher:
+    """
+    Wraps a DataLoader and copies the next batch to the GPU on a separate CUDA stream while the 
+    current batch is being used, so the host to device copies overlap with the computations.
+    """
+    def __init__(self, loader, device):
+        self.loader = loader
+        self.dataset = loader.dataset
+        self.device = device
+        self.stream = torch.cuda.Stream(device)
+    
+    def __len__(self):
+        return len(self.loader)
+    
+    def __iter__(self):
+        loader_iter = iter(self.loader)
+        next_batch = self._preload(loader_iter)
+        while next_batch is not None:
+            # Waiting for the copy of the batch to finish before handing it out
+            current_stream = torch.cuda.current_stream(self.device)
+            current_stream.wait_stream(self.stream)
+            batch = next_batch
+            for tensor in batch:
+                tensor.record_stream(current_stream)
+            next_batch = self._preload(loader_iter)
+            yield batch
+    
+    def _preload(self, loader_iter):
+        try:
+            batch = next(loader_iter)
+        except StopIteration:
+            return None
+        with torch.cuda.stream(self.stream):
+            return tuple(tensor.to(self.device, non_blocking = True) for tensor in batch)
+
+def make_loader(data, batch_size, device, shuffle = True, persistent = False):
+    """
+    Creates a DataLoader for the dataset. On CUDA devices the batches are loaded into pinned 
+    memory and copied to the GPU ahead of time by a data_prefetcher, and persistent loaders 
+    also load the batches in worker processes that are kept alive between the epochs. 
+    On other devices the batches are loaded in the main process, since the worker processes 
+    would only add pickling overhead for an in-memory dataset.
+
+    Parameters
+    ----------
+    data : obj
+        PyTorch Dataset object.
+    batch_size : int
+        Number of samples in each batch.
+    device : obj
+        PyTorch device object the batches are used on.
+    shuffle : boolean, optional
+        Whether to shuffle the data at every epoch. The default is True.
+    persistent : boolean, optional
+        Whether to use persistent worker processes, meant for the loader iterated over at every 
+        epoch. The default is False.
 
-def process_data(max_len = 500, train_size = 0.8, validation_size = 0.15, test_size = 0.05):
+    Returns
+    -------
+    loader : obj
+        DataLoader object, wrapped by a data_prefetcher on CUDA devices.
+    """
+    
+    use_cuda = device.type == "cuda"
+    num_workers = (os.cpu_count() or 0) if persistent and use_cuda else 0
+    loader = DataLoader(data, batch_size = batch_size, shuffle = shuffle, num_workers = num_workers, pin_memory = use_cuda,
+                        persistent_workers = num_workers > 0, prefetch_factor = 4 if num_workers else None)
+    if use_cuda:
+        return data_prefetcher(loader, device)
+    return loader
+
+def process_data(max_len = 500, train_size = 0.8, validation_size = 0.15, test_size = 0.05, save_csv = False):
     """
     Downloads the data from the S# bucket on AWS, transforms it, balances it, creates a vocbulary from the
     review texts, converts the text into sequences of indices, divides the data into 
@@ -204,6 +427,9 @@ def process_data(max_len = 500, train_size = 0.8, validation_size = 0.15, test_s
         Fraction of validation data of all data. The default is 0.15.
     test_size : int, optional
         Fraction of test data of all data. The default is 0.05.
+    save_csv : boolean, optional
+        Whether to save the intermediate transformed, balanced and split datasets as CSV files.
+        The default is False.
 
     Returns
     -------
@@ -221,37 +447,41 @@ def process_data(max_len = 500, train_size = 0.8, validation_size = 0.15, test_s
         os.mkdir("./../data/raw_data")
     
     if "womens_clothing_ecommerce_reviews.csv" not in os.listdir("./../data/raw_data"):
-        subprocess.run("aws s3 cp s3://dlai-practical-data-science/data/raw/womens_clothing_ecommerce_reviews.csv ./../data/raw_data",\
-                       shell=True)
+        s3 = boto3.client("s3", config = Config(max_pool_connections = 16))
+        s3.download_file("dlai-practical-data-science", "data/raw/womens_clothing_ecommerce_reviews.csv",
+                         "./../data/raw_data/womens_clothing_ecommerce_reviews.csv",
+                         Config = TransferConfig(multipart_threshold = 8 * 1024 * 1024, max_concurrency = 8))
     
     
-    # Reading the data
-    data = pd.read_csv("./../data/raw_data/womens_clothing_ecommerce_reviews.csv")
-    # Keeping the useful columns
-    data_transformed =  data[["Review Text", "Rating", "Class Name"]].copy()
+    # Reading only the useful columns of the data into Arrow backed columns
+    data_transformed = pd.read_csv("./../data/raw_data/womens_clothing_ecommerce_reviews.csv", engine = "pyarrow",
+                                   usecols = ["Review Text", "Rating", "Class Name"], dtype_backend = "pyarrow")
     # Renaming the columns for convenience
     data_transformed.rename(columns = {"Review Text":'review', "Rating":"rating", "Class Name":"product_category"}, inplace = True)
     # dropping the rows wth empty cells 
     data_transformed.dropna(inplace = True)
     # Removing the data for product categories with less than 10 reviews
-    data_transformed  = data_transformed.groupby("product_category").filter(lambda review: len(review) > 10)
+    category_counts = data_transformed["product_category"].value_counts()
+    data_transformed = data_transformed[data_transformed["product_category"].isin(category_counts[category_counts > 10].index)].copy()
     # Converting the star rating to sentiment and dropping the rating column as it is not needed anymore
-    data_transformed["sentiment"] = data_transformed["rating"].apply(lambda rating: rating_to_sentiment(rating))
+    data_transformed["sentiment"] = np.where(data_transformed["rating"].to_numpy() > 3, 1, 0).astype(np.int8)
     data_transformed.drop(columns = "rating", inplace = True)
     # Saving the transformed dataset
-    data_transformed.to_csv("./../data/raw_data/womens_clothing_ecommerce_reviews_transformed.csv", index = False)
+    if save_csv:
+        data_transformed.to_csv("./../data/raw_data/womens_clothing_ecommerce_reviews_transformed.csv", index = False)
     
     
     #------------------------------------------------------------------------------
     # Balancing the dataset
     
     # Balancing the dataset based on the sentiments so we have the same number of reviews for both sentiments
-    data_transformed_grouped_for_balance = data_transformed.groupby(["sentiment"])[["review","sentiment", "product_category"]]
-    data_transformed_balanced = data_transformed_grouped_for_balance.apply(lambda x: \
-                                    x.sample(data_transformed.groupby(["sentiment"]).size().min()))\
-                                    .reset_index(drop = True)# Saving the balanced dataset
+    min_sentiment_count = data_transformed["sentiment"].value_counts().min()
+    data_transformed_balanced = data_transformed.groupby("sentiment", group_keys = False)[["review","sentiment", "product_category"]]\
+                                    .sample(n = min_sentiment_count, random_state = 5)\
+                                    .reset_index(drop = True)
     # Saving the balanced dataset
-    data_transformed_balanced.to_csv("./../data/raw_data/womens_clothing_ecommerce_reviews_balanced.csv", index = False)
+    if save_csv:
+        data_transformed_balanced.to_csv("./../data/raw_data/womens_clothing_ecommerce_reviews_balanced.csv", index = False)
     
     # Creating the required directories to save the data
     if "training" not in os.listdir("./../data"):
@@ -268,60 +498,58 @@ def process_data(max_len = 500, train_size = 0.8, validation_size = 0.15, test_s
     validation_data, test_data = train_test_split(temp_data, test_size = test_size / (test_size + validation_size), random_state = 10)
     
     # Saving the train, validation and test datasets
-    training_data.to_csv("./../data/training/womens_clothing_ecommerce_reviews_balanced_training.csv", index = False)
-    validation_data.to_csv("./../data/validation/womens_clothing_ecommerce_reviews_balanced_validation", index = False)
-    test_data.to_csv("./../data/test/womens_clothing_ecommerce_reviews_balanced_test", index = False)
+    if save_csv:
+        training_data.to_csv("./../data/training/womens_clothing_ecommerce_reviews_balanced_training.csv", index = False)
+        validation_data.to_csv("./../data/validation/womens_clothing_ecommerce_reviews_balanced_validation", index = False)
+        test_data.to_csv("./../data/test/womens_clothing_ecommerce_reviews_balanced_test", index = False)
     
     #------------------------------------------------------------------------------
     # Preprocessing the data for the NLP task
     
-    # Creating a text corpus from the training and validation data
-    corpus_data = pd.concat([training_data["review"], validation_data["review"]], axis = 0)
-    corpus = '\n'.join(training_data["review"].values)
+    # Cleaning the review texts of all the splits in bulk
+    for data in (training_data, validation_data, test_data):
+        data["review_cleaned"] = cleanup_texts(data["review"])
     
-    # Saing the text corpus for future references and use
+    # Saing the training reviews as a text corpus for future references and use
     with open("./../data/corpus.txt", "w") as file:
-        file.write(corpus)
-    
-    # Cleaning he corpus text
-    corpus_cleaned = cleanup_text(corpus)
-    # Creating a vocabulary from the text corpus
-    vocabulary = create_vocab(corpus_cleaned, word_tokenize, WordNetLemmatizer(), "<unk>", "<pad>")
+        for review in training_data["review"]:
+            file.write(review)
+            file.write("\n")
+    
+    # Creating a single lemmatizer shared by the vocabulary creation and review processing
+    lemmatizer = WordNetLemmatizer()
+    # Creating a vocabulary from the cleaned training reviews
+    vocabulary = create_vocab(training_data["review_cleaned"], word_tokenize, lemmatizer, "<unk>", "<pad>")
     # Saving the vocabulary for future reference and use
     torch.save(vocabulary, './../data/vocabulary.pth')
-    
-    # Processing the reviews in the datasets and converting the review text to list of indices
-    training_data["review_processed"] = training_data["review"]\
-        .apply(lambda x: process_reviews(x, word_tokenize, WordNetLemmatizer(), vocabulary, max_len))
-    validation_data["review_processed"] = validation_data["review"]\
-        .apply(lambda x: process_reviews(x, word_tokenize, WordNetLemmatizer(), vocabulary, max_len))
-    test_data["review_processed"] = test_data["review"]\
-        .apply(lambda x: process_reviews(x, word_tokenize, WordNetLemmatizer(), vocabulary, max_len))
-    
-    # Keeping only the required columns of the datsets
-    training_data_processed = training_data[["review_processed", "sentiment"]]
-    validation_data_processed  = validation_data[["review_processed", "sentiment"]]
-    test_data_processed  = test_data[["review_processed", "sentiment"]]
-    
-    # Saving the datasets for future use and reference
-    training_data_processed.to_csv("./../data/training/training_data_processed.csv", index = False)
-    validation_data_processed.to_csv("./../data/validation/validation_data_processed.csv", index = False)
-    test_data_processed.to_csv("./../data/test/test_data_processed.csv", index = False)
-    
-    # Converting the dataframe data into tensors
-    training_data_tensor = convert_to_tensor(training_data_processed)
-    validation_data_tensor = convert_to_tensor(validation_data_processed)
-    test_data_tensor = convert_to_tensor(test_data_processed)
-    
-    # Creating torch Datasets
-    train_dataset = dataset(training_data_tensor)
-    validaton_dataset = dataset(validation_data_tensor)
-    test_dataset = dataset(test_data_tensor)
-    
-    # Saving the torch Datasets for future sse and reference
-    torch.save(train_dataset, "./../data/training/training_dataset.pth")
-    torch.save(validaton_dataset, "./../data/validation/validation_dataset.pth")
-    torch.save(test_dataset, "./../data/test/test_dataset.pth")
+    # Creating the token to index dictionary used for processing the reviews
+    token2idx, unk_index = create_token_index(vocabulary)
+    
+    # The processed data and the torch Dataset paths of each split
+    splits = [(training_data, "./../data/training/training_data_processed.parquet", "./../data/training/training_dataset.pth"),
+              (validation_data, "./../data/validation/validation_data_processed.parquet", "./../data/validation/validation_dataset.pth"),
+              (test_data, "./../data/test/test_data_processed.parquet", "./../data/test/test_dataset.pth")]
+    
+    # Processing the reviews of all the splits in a single pool of worker processes. All the splits 
+    # are queued at once, so saving a finished split overlaps with processing the remaining ones.
+    with Pool(cpu_count(), initializer = _init_worker, initargs = (word_tokenize, lemmatizer, token2idx, unk_index, max_len)) as pool:
+        pending = [(data, pool.imap(_encode_review_worker, data["review_cleaned"], chunksize = 512), data_path, dataset_path)
+                   for data, data_path, dataset_path in splits]
+        
+        for data, results, data_path, dataset_path in pending:
+            # Converting the review text to arrays of indices, collected into a single contiguous array
+            reviews_processed = np.empty((len(data), max_len), dtype = np.int32)
+            for i, review_processed in enumerate(results):
+                reviews_processed[i] = review_processed
+            sentiments = data["sentiment"].to_numpy(np.int32)
+            
+            # Saving the dataset for future use and reference. The indices are stored as a fixed 
+            # size list column backed by the contiguous array instead of a list per row.
+            data_processed = pa.table({"review_processed": pa.FixedSizeListArray.from_arrays(pa.array(reviews_processed.ravel()), max_len),
+                                       "sentiment": sentiments})
+            pq.write_table(data_processed, data_path)
+            # Converting the data into tensors, creating a torch Dataset and saving it
+            torch.save(dataset(*convert_to_tensor(reviews_processed, sentiments)), dataset_path)
 
 
 
@@ -4,10 +4,7 @@ from training import sentiment
 from nltk.tokenize import word_tokenize
 from nltk.stem import WordNetLemmatizer
 import re
-import nltk
-nltk.download("punkt")
-nltk.download('wordnet')
-from data_preparation import process_reviews
+from data_preparation import process_reviews, create_token_index
 
 
 def predict(model, tokenizer, lemmatizer, reviews, threshold, max_len):
@@ -42,9 +39,10 @@ def predict(model, tokenizer, lemmatizer, reviews, threshold, max_len):
         model.eval()
         # Reading the vocabulary 
         vocabulary = torch.load("./../data/vocabulary.pth")
+        token2idx, unk_index = create_token_index(vocabulary)
         predictions = []
         for review in reviews:
-            review_processed = process_reviews(review, tokenizer, lemmatizer, vocabulary, max_len)
+            review_processed = process_reviews(review, tokenizer, lemmatizer, token2idx, unk_index, max_len)
             prediction = torch.where(model.sigmoid(model(torch.tensor(review_processed).reshape(1, -1))) >= threshold, torch.tensor(1), torch.tensor(0))
             if prediction == 1:
                 predictions.append("Positive")
@@ -1,8 +1,5 @@
 from nltk.tokenize import word_tokenize
 from nltk.stem import WordNetLemmatizer
-import nltk
-nltk.download("punkt")
-nltk.download('wordnet')
 from data_preparation import process_data
 from training import train_model
 from inference import predict